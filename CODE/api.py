@@ -1,17 +1,30 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+import itertools
+import os
+import re
 import time
-from gtts import gTTS
-from googletrans import Translator
-from typing import Dict, Any
-from news_scraping import process_news, comparative_analysis, final_summary  # Import backend functions
+from typing import Dict, Any, List, Literal, Optional
+from news_scraping import process_news, comparative_analysis, final_summary, translate_and_speak, translate_text, audio_path, audio_id_for, stream_speech, make_deadline, DEFAULT_LANGUAGES, LANGUAGE_NAMES, TTS_WORKERS, AUDIO_CHUNK_SIZE  # Import backend functions
 
 # Initialize the FastAPI application
 app = FastAPI()
 
+# Audio ids are "<lang>_<hash>"; anything else could escape the audio directory
+AUDIO_ID_PATTERN = re.compile(r'^[a-z]{2,3}(-[A-Za-z]{2,4})?_[0-9a-f]{32}$')
+
+# Audio ids are content hashes, so a stored file never changes
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Language codes accepted for translated summaries; anything else is rejected with a 422
+LanguageCode = Literal[tuple(LANGUAGE_NAMES)]
+
 # Define the request model for the `/fetch_news/` endpoint
 class NewsRequest(BaseModel):
     company: str  # The company name for which news articles will be fetched
+    languages: List[LanguageCode] = DEFAULT_LANGUAGES  # Language codes for translated summaries and audio
+    max_latency_ms: Optional[int] = Field(None, gt=0)  # Latency budget; partial results are returned when it runs out
 
 @app.get("/")
 def home():
@@ -24,22 +37,35 @@ def fetch_news(data: NewsRequest):
     Fetch news articles, analyze sentiment, and generate summaries.
     
     Args:
-        data (NewsRequest): The request body containing the company name.
+        data (NewsRequest): The request body containing the company name, the
+                            target languages and an optional latency budget.
     
     Returns:
         dict: A dictionary containing fetched articles, comparative analysis, 
-              and summaries in English and Hindi.
+              the English summary, a language -> {text, audio_id} map of
+              translated summaries, pipeline metrics, and a "complete" flag
+              that is False when the latency budget cut any stage short.
     """
+    start = time.monotonic()
+    deadline = make_deadline(data.max_latency_ms)  # None when no budget is given
     company = data.company  # Extract the company name from the request
-    news_data = process_news(company)  # Fetch news articles
+    metrics = {}  # Filled with search, relevance and download statistics by process_news
+    news_data = process_news(company, metrics, deadline=deadline)  # Fetch news articles
+    incomplete_stages = metrics["incomplete_stages"]
     
     if not news_data:
         # Return an error message if no articles are found
-        return {"error": "No news articles found."}
+        return {"error": "No news articles found.", "complete": not incomplete_stages, "metrics": metrics}
     
     # Perform comparative analysis and generate summaries
     analysis = comparative_analysis(news_data)
-    final_summ = final_summary(news_data, company)
+    final_summ = final_summary(news_data, company, data.languages, deadline)
+    
+    # Record optional stages (translation, audio) left out to meet the budget
+    for result in final_summ["translations"].values():
+        if result.get("skipped") and result["skipped"] not in incomplete_stages:
+            incomplete_stages.append(result["skipped"])
+    metrics["latency_ms"] = round((time.monotonic() - start) * 1000)
 
     # Prepare the output response
     output = {
@@ -48,34 +74,161 @@ def fetch_news(data: NewsRequest):
         "articles": news_data,  # List of fetched articles
         "comparative_analysis": analysis,  # Sentiment and topic analysis
         "final_summary": final_summ["text_summary"],  # Final summary in English
-        "hindi_summary": final_summ["hindi_summary"]  # Final summary in Hindi
+        "hindi_summary": final_summ["hindi_summary"],  # Final summary in Hindi
+        "translations": final_summ["translations"],  # Translated summaries and audio ids per language
+        "metrics": metrics,  # Search, relevance, download and latency statistics
+        "complete": not incomplete_stages  # False if the latency budget cut any stage short
     }
 
     return output  # Return the response as JSON
 
 @app.get("/generate_tts/")
-def generate_tts(text: str):
+def generate_tts(text: str, lang: str = "hi"):
     """
-    Generate Hindi Text-to-Speech (TTS) from the given text.
+    Generate Text-to-Speech (TTS) in the requested language from the given text.
     
     Args:
-        text (str): The input text to be converted to Hindi TTS.
+        text (str): The input English text to be translated and converted to speech.
+        lang (str): The target language code, Hindi by default.
     
     Returns:
-        dict: A dictionary containing the translated Hindi text and the audio file name.
+        dict: A dictionary containing the translated text, the audio id and the audio file name.
     """
     try:
-        # Translate the input text to Hindi
-        translator = Translator()
-        hindi_text = translator.translate(text, dest='hi').text
-
-        # Generate TTS audio from the Hindi text
-        tts = gTTS(text=hindi_text, lang='hi')
-        audio_filename = f"summary_{time.strftime('%Y%m%d_%H%M%S')}.mp3"  # Unique filename
-        tts.save(audio_filename)  # Save the audio file
+        # Translate the input text and generate TTS audio from the translation
+        result = translate_and_speak(text, lang)
 
-        # Return the Hindi text and audio file name
-        return {"hindi_text": hindi_text, "audio_file": audio_filename}
+        # Return the translated text and audio file name
+        response = {
+            "text": result["text"],
+            "audio_id": result["audio_id"],
+            "audio_file": audio_path(result["audio_id"]),
+            "audio_url": f"/audio/{result['audio_id']}"  # Served by the audio endpoint
+        }
+        if lang == "hi":
+            response["hindi_text"] = result["text"]  # Kept for existing Hindi clients
+        return response
     except Exception as e:
         # Handle any errors during translation or TTS generation
         return {"error": str(e)}
+
+def parse_range(range_header: str, size: int):
+    """
+    Parse a single-range HTTP Range header.
+    
+    Args:
+        range_header (str): The Range header value, e.g. "bytes=0-1023".
+        size (int): Size of the file in bytes.
+    
+    Returns:
+        tuple: Inclusive (start, end) byte positions, or None when the header should
+               be ignored and the whole file served (multiple, malformed or
+               invalid ranges such as "bytes=5-3").
+    
+    Raises:
+        HTTPException: 416 when the range starts beyond the end of the file.
+    """
+    match = re.fullmatch(r'bytes=(\d*)-(\d*)', range_header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start:
+        start = int(start)
+        if end and int(end) < start:
+            # Syntactically invalid (last < first), so the header is ignored
+            return None
+        end = min(int(end), size - 1) if end else size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(end), 0)
+        end = size - 1
+    if start >= size:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+def read_file_range(path: str, start: int, end: int):
+    """Yield the bytes of a file between two inclusive positions in chunks."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(AUDIO_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+@app.get("/audio/{audio_id}")
+def get_audio(audio_id: str, range: Optional[str] = Header(None), if_none_match: Optional[str] = Header(None),
+              if_range: Optional[str] = Header(None)):
+    """
+    Stream a generated MP3 file with HTTP Range and caching support.
+    
+    Args:
+        audio_id (str): The audio id returned by `/fetch_news/` or `/generate_tts/`.
+        range (str): Optional Range header for partial content.
+        if_none_match (str): Optional If-None-Match header for revalidation.
+        if_range (str): Optional If-Range header; the range is only honoured when it matches.
+    
+    Returns:
+        StreamingResponse: The full file (200) or the requested byte range (206).
+    """
+    path = audio_path(audio_id)
+    if not AUDIO_ID_PATTERN.match(audio_id) or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Audio not found")
+    
+    etag = f'"{audio_id}"'
+    headers = {"ETag": etag, "Cache-Control": AUDIO_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+        return Response(status_code=304, headers=headers)
+    
+    size = os.path.getsize(path)
+    byte_range = parse_range(range, size) if range and (not if_range or if_range == etag) else None
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(read_file_range(path, 0, size - 1), media_type="audio/mpeg", headers=headers)
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(read_file_range(path, start, end), status_code=206, media_type="audio/mpeg", headers=headers)
+
+@app.get("/stream_tts/")
+def stream_tts(text: str, lang: str = "hi"):
+    """
+    Translate text and stream its speech while later sentences are still being synthesized.
+    
+    Args:
+        text (str): The input English text to be translated and converted to speech.
+        lang (str): The target language code, Hindi by default.
+    
+    Returns:
+        StreamingResponse: Chunked MP3 audio; once complete it is also available,
+                           with Range support, at the URL in the Content-Location header.
+    
+    Raises:
+        HTTPException: 502 when translation or the first sentence's synthesis fails.
+    """
+    try:
+        translated = translate_text(text, lang)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Translation failed: {e}")
+    
+    # Synthesize the first sentence before committing to a 200, so TTS failures
+    # (unsupported language, rate limiting, network) are reported as errors
+    chunks = stream_speech(translated, lang, TTS_WORKERS)
+    try:
+        first_chunk = next(chunks)
+    except StopIteration:
+        raise HTTPException(status_code=502, detail="Speech synthesis produced no audio")
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Speech synthesis failed: {e}")
+    
+    audio_id = audio_id_for(translated, lang)
+    headers = {
+        "ETag": f'"{audio_id}"',
+        "Content-Location": f"/audio/{audio_id}",
+        "X-Audio-Id": audio_id,
+        "Cache-Control": "no-cache"  # A live stream may be cut short, so clients revalidate
+    }
+    return StreamingResponse(itertools.chain([first_chunk], chunks), media_type="audio/mpeg", headers=headers)
@@ -5,11 +5,10 @@ import requests
 import json
 import asyncio
 from googletrans import Translator
-from gtts import gTTS  # For Text to Speech conversion
 import os
 
 # Importing the functions from your backend
-from news_scraping import process_news, comparative_analysis, final_summary  
+from news_scraping import process_news, comparative_analysis, final_summary, audio_path, DEFAULT_LANGUAGES, LANGUAGE_NAMES  
 
 # Function to display articles in the Streamlit app
 def display_articles(news_data):
@@ -38,19 +37,24 @@ def display_comparative_analysis(analysis):
     st.write(f"**Common Topics:** {', '.join(analysis['topic_overlap']['common_topics'])}")  # Common topics
     st.write(f"**Unique Topics:** {', '.join(analysis['topic_overlap']['unique_topics'])}")  # Unique topics
 
-# Asynchronous function to generate Hindi summary and audio file
-def generate_hindi_summary_and_audio(text_summary):
-    # Translate the English summary to Hindi
-    translator = Translator()
-    translated = translator.translate(text_summary, src='en', dest='hi')
-    hindi_summary = translated.text  # Extract translated text
-    
-    # Convert the Hindi summary to audio using gTTS
-    audio_file_path = "hindi_summary.mp3"
-    tts = gTTS(hindi_summary, lang='hi', slow=False)
-    tts.save(audio_file_path)  # Save the audio file
-    
-    return hindi_summary, audio_file_path  # Return the Hindi summary and audio file path
+# Function to display the translated summaries and play their audio
+def display_translations(translations):
+    for lang, result in translations.items():
+        st.write(f"### {LANGUAGE_NAMES.get(lang, lang)} Summary")  # Subsection per language
+        if result["text"]:
+            st.write(result["text"])  # Display the translated summary
+        if result["audio_id"]:
+            st.audio(audio_path(result["audio_id"]))  # Play the generated audio
+            continue
+        
+        # Name the stage that is missing; failures are limited to this language
+        stage = "audio" if result["text"] else "translation"
+        if result.get("skipped"):
+            st.warning(f"The {result['skipped']} was skipped to stay within the time limit.")
+        elif result.get("error"):
+            st.warning(f"Could not generate the {stage}: {result['error']}")
+        else:
+            st.warning(f"Could not generate the {stage}.")
 
 # Main function to run the Streamlit app
 def main():
@@ -59,6 +63,14 @@ def main():
     # Input field for the company name
     company_name = st.text_input("Enter the Company Name:")
     
+    # Languages for the translated summary and audio
+    languages = st.multiselect(
+        "Summary Languages:",
+        options=list(LANGUAGE_NAMES),
+        default=DEFAULT_LANGUAGES,
+        format_func=lambda lang: LANGUAGE_NAMES[lang]
+    )
+    
     # Button to fetch news articles
     if st.button("Fetch News"):
         if company_name:
@@ -75,22 +87,12 @@ def main():
                     analysis = comparative_analysis(news_data)
                     display_comparative_analysis(analysis)  # Display analysis results
 
-                    # Generate the final summary
-                    final_summ = final_summary(news_data, company_name)
+                    # Generate the final summary, translated and voiced in every selected language
+                    final_summ = final_summary(news_data, company_name, languages)
                     st.write("## Final Summary")  # Section header
                     st.write(final_summ["text_summary"])  # Display the final summary
                     
-                    # Generate Hindi summary and TTS audio
-                    hindi_summary, audio_file_path = generate_hindi_summary_and_audio(final_summ["text_summary"])
-
-                    # Debugging lines to verify Hindi summary and audio file path
-                    ##st.write("Final Hindi Summary Check:", hindi_summary)
-                    ##st.write("Audio File Path:", audio_file_path)
-
-                    if hindi_summary:
-                        st.write("### Hindi Summary")  # Subsection for Hindi summary
-                        ##st.write(hindi_summary)  # Display the Hindi summary
-                        st.audio(audio_file_path)  # Play the generated audio
+                    display_translations(final_summ["translations"])  # Display translated summaries and audio
                     
                     # Prepare downloadable JSON output
                     output = {
@@ -98,7 +100,8 @@ def main():
                         "articles": news_data,
                         "comparative_analysis": analysis,
                         "final_summary": final_summ["text_summary"],
-                        "hindi_summary": hindi_summary
+                        "hindi_summary": final_summ["hindi_summary"],
+                        "translations": {lang: result["text"] for lang, result in final_summ["translations"].items()}
                     }
                     
                     # Provide a download button for the JSON output
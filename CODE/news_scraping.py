@@ -1,51 +1,390 @@
 import re
+import codecs
 import requests
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor, wait
 import time
 import json
 from collections import Counter
+from functools import lru_cache
 from textblob import TextBlob
 import urllib.parse
+import uuid
 from gtts import gTTS
 from googletrans import Translator
 import os
+import io
+import hashlib
+import threading
 
-# Function to fetch content from a URL
-def fetch_content(url):
+# Share of the remaining latency budget given to search and to article fetching;
+# the rest is kept for analysis, translation and audio
+SEARCH_BUDGET_SHARE = 0.4
+FETCH_BUDGET_SHARE = 0.75
+
+# Optional stages are skipped when less than this many seconds remain
+TRANSLATION_MIN_SECONDS = 1.0
+AUDIO_MIN_SECONDS = 2.0
+
+# Function to turn a latency budget into a deadline
+def make_deadline(max_latency_ms):
     """
-    Extract article content from a URL.
+    Convert a latency budget into an absolute deadline.
+    
+    Args:
+        max_latency_ms (int): Budget in milliseconds, or None for no limit
+        
+    Returns:
+        float: Deadline on the `time.monotonic` clock, or None for no limit
+    """
+    return None if max_latency_ms is None else time.monotonic() + max_latency_ms / 1000
+
+# Function to get the time left before a deadline
+def remaining_time(deadline):
+    """
+    Get the seconds left before a deadline.
+    
+    Args:
+        deadline (float): Deadline from `make_deadline`, or None for no limit
+        
+    Returns:
+        float: Seconds left (never negative), or None when there is no deadline
+    """
+    return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+# Function to cap a timeout so it does not run past a deadline
+def bounded_timeout(timeout, deadline):
+    """
+    Shorten a timeout so it ends no later than the deadline.
+    
+    Args:
+        timeout (float): The timeout used when there is no deadline
+        deadline (float): Deadline from `make_deadline`, or None for no limit
+        
+    Returns:
+        float: The timeout to use
+    """
+    remaining = remaining_time(deadline)
+    return timeout if remaining is None else min(timeout, remaining)
+
+# Function to tell a timeout caused by the latency budget from other errors
+def is_deadline_timeout(error, deadline):
+    """
+    Check whether a request error means the latency budget ran out.
+    
+    Args:
+        error (Exception): The error raised by the request
+        deadline (float): Deadline from `make_deadline`, or None for no limit
+        
+    Returns:
+        bool: True if a deadline was set and the request timed out or the
+              deadline has passed (a read timeout mid-body can surface as a
+              connection error)
+    """
+    if deadline is None:
+        return False
+    return isinstance(error, requests.Timeout) or remaining_time(deadline) == 0
+
+# Function to derive the deadline of one stage from the overall deadline
+def stage_deadline(deadline, share):
+    """
+    Get a deadline that leaves part of the remaining budget for later stages.
+    
+    Args:
+        deadline (float): Overall deadline, or None for no limit
+        share (float): Fraction of the remaining time given to this stage
+        
+    Returns:
+        float: The stage deadline, or None for no limit
+    """
+    remaining = remaining_time(deadline)
+    return None if remaining is None else time.monotonic() + remaining * share
+
+# Streaming fetch limits: stop reading a page after this many bytes, read it
+# in chunks of this size, and stop parsing once enough article text has been
+# collected for analysis. Sentiment only uses the first 500 characters and the
+# summary the first two sentences, but keywords are counted over all of the
+# collected text, so they come from the first ANALYSIS_CHAR_BUDGET characters
+# of the article rather than the whole of it
+MAX_ARTICLE_BYTES = 512 * 1024
+FETCH_CHUNK_SIZE = 16 * 1024
+ANALYSIS_CHAR_BUDGET = 3000
+
+# Content types worth downloading and parsing
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Pattern used to spot the main article container by its class attribute
+ARTICLE_CLASS_PATTERN = re.compile(r'article|content|story')
+
+# Elements that never have a closing tag and so cannot act as a container
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+# Incremental HTML parser collecting the title and paragraph text of a page
+class ArticleParser(HTMLParser):
+    """
+    Collect the title, first h1 and paragraph text from HTML fed in chunks.
+    
+    Like the BeautifulSoup lookup used before, only the first <article> element
+    and the first element whose class looks like article content are treated as
+    containers. Their paragraphs are kept separately, and `content` prefers the
+    <article> paragraphs, then the class-matched ones, then the whole page.
+    """
+    def __init__(self):
+        super().__init__()
+        self.title = ""
+        self.h1 = ""
+        self.all_paragraphs = []
+        self.all_chars = 0
+        self._current = None        # Text parts of the paragraph being read
+        self._in_title = False
+        self._in_h1 = False
+        self._skip_depth = 0        # Depth inside <script>/<style>
+        # State of the first <article> and of the first class-matched container
+        self._containers = {
+            'article': {"tag": None, "depth": 0, "done": False, "paragraphs": [], "chars": 0},
+            'class': {"tag": None, "depth": 0, "done": False, "paragraphs": [], "chars": 0}
+        }
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
+            return
+        if tag == 'p':
+            # Browsers implicitly close an open paragraph when a new one starts
+            self._close_paragraph()
+            self._current = []
+        elif tag == 'title' and not self.title:
+            self._in_title = True
+        elif tag == 'h1' and not self.h1:
+            self._in_h1 = True
+        if tag in VOID_ELEMENTS:
+            return
+        
+        article = self._containers['article']
+        if article["tag"] is None and not article["done"] and tag == 'article':
+            article["tag"] = tag
+        matched = self._containers['class']
+        if matched["tag"] is None and not matched["done"]:
+            if ARTICLE_CLASS_PATTERN.search(dict(attrs).get('class') or ''):
+                matched["tag"] = tag
+        for container in self._containers.values():
+            if tag == container["tag"]:
+                container["depth"] += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if tag == 'p':
+            self._close_paragraph()
+        elif tag == 'title':
+            self._in_title = False
+        elif tag == 'h1':
+            self._in_h1 = False
+        for container in self._containers.values():
+            if tag != container["tag"]:
+                continue
+            container["depth"] -= 1
+            if container["depth"] <= 0:
+                # Flush before leaving so the paragraph is attributed to the container
+                self._close_paragraph()
+                # Only the first container counts, as with soup.find
+                container["tag"] = None
+                container["depth"] = 0
+                container["done"] = True
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._current is not None:
+            self._current.append(data)
+        if self._in_title:
+            self.title += data
+        elif self._in_h1:
+            self.h1 += data
+
+    def _close_paragraph(self):
+        if self._current is None:
+            return
+        text = ''.join(self._current).strip()
+        self._current = None
+        if not text:
+            return
+        self.all_paragraphs.append(text)
+        self.all_chars += len(text)
+        for container in self._containers.values():
+            if container["tag"] is not None:
+                container["paragraphs"].append(text)
+                container["chars"] += len(text)
+
+    def _preferred(self):
+        """Paragraphs and character count of the text `content` would return."""
+        for name in ('article', 'class'):
+            container = self._containers[name]
+            if container["paragraphs"]:
+                return container["paragraphs"], container["chars"]
+        return self.all_paragraphs, self.all_chars
+
+    def has_enough_text(self, char_budget):
+        """
+        Check whether reading more of the page can no longer change what matters.
+        
+        Only the <article> container counts, as it is preferred over everything
+        else: paragraphs before it (cookie banners, navigation) or in a wrapping
+        class-matched element must not end the download before it is reached.
+        """
+        article = self._containers['article']
+        return article["done"] or article["chars"] >= char_budget
+
+    def content(self):
+        """Preferred container paragraphs if any were found, otherwise all paragraphs."""
+        self._close_paragraph()
+        return ' '.join(self._preferred()[0])
+
+# Function to fetch an article with a bounded, streaming download
+def fetch_article(url, max_bytes=MAX_ARTICLE_BYTES, char_budget=ANALYSIS_CHAR_BUDGET, deadline=None):
+    """
+    Stream an article, parsing it incrementally until enough text is collected.
+    
+    The response body is read in chunks and fed to an incremental parser. Reading
+    stops as soon as the page's <article> holds `char_budget` characters of
+    paragraph text or has ended, or `max_bytes` have been downloaded (pages
+    without an <article> are read up to that cap), and non-HTML responses are dropped as soon
+    as their headers arrive without reading the body. When a deadline is given,
+    reading also stops once it passes and whatever text was parsed is returned.
     
     Args:
         url (str): The URL to fetch content from
+        max_bytes (int): Maximum number of body bytes to download
+        char_budget (int): Article paragraph characters needed before parsing stops
+        deadline (float, optional): Deadline from `make_deadline`
         
     Returns:
-        str: The extracted text content from the article
+        dict: Extracted "content" and "title" plus a "stats" dictionary with the
+              body bytes read, the bytes transferred, the declared content length
+              and why reading stopped
     """
     # Set user agent to mimic browser behavior
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
+    stats = {
+        "url": url,
+        "bytes_read": 0,
+        "bytes_transferred": 0,
+        "content_length": None,
+        "truncated": False,
+        "skipped": False,
+        "timed_out": False,
+        "error": False
+    }
+    parser = ArticleParser()
+    if remaining_time(deadline) == 0:
+        stats["timed_out"] = True
+        return {"content": "", "title": "", "stats": stats}
     try:
-        # Send request and get response
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()  # Raise exception for HTTP errors
-        
-        # Parse HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Only the headers are read here, the body is pulled chunk by chunk below
+        with requests.get(url, headers=headers, timeout=bounded_timeout(10, deadline), stream=True) as response:
+            response.raise_for_status()  # Raise exception for HTTP errors
+            
+            declared_length = response.headers.get('Content-Length', '')
+            if declared_length.isdigit():
+                stats["content_length"] = int(declared_length)
+            
+            # Skip non-HTML content (PDFs, images, feeds) before reading the body
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                stats["skipped"] = True
+                return {"content": "", "title": "", "stats": stats}
+            
+            # Decode incrementally so multi-byte characters split across chunks survive
+            encoding = response.encoding if 'charset' in content_type else 'utf-8'
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            except LookupError:
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            
+            for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+                if not chunk:
+                    continue
+                remaining = max_bytes - stats["bytes_read"]
+                chunk = chunk[:remaining]
+                stats["bytes_read"] += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                
+                # Stop once there is enough article text to analyze or the byte cap is hit
+                if parser.has_enough_text(char_budget) or stats["bytes_read"] >= max_bytes:
+                    stats["truncated"] = True
+                    break
+                # Out of time: keep the text parsed so far
+                if remaining_time(deadline) == 0:
+                    stats["truncated"] = True
+                    stats["timed_out"] = True
+                    break
+            else:
+                parser.feed(decoder.decode(b'', final=True))
+            
+            # Bytes pulled off the wire, which differ from the body size when compressed
+            try:
+                stats["bytes_transferred"] = response.raw.tell()
+            except Exception:
+                stats["bytes_transferred"] = stats["bytes_read"]
         
-        # Try to locate main article content using common patterns
-        article_content = soup.find('article') or soup.find(class_=re.compile(r'article|content|story'))
+        parser.close()
+    except Exception as e:
+        if not is_deadline_timeout(e, deadline):
+            print(f"Error fetching {url}: {e}")
+            stats["error"] = True
+            return {"content": "", "title": "", "stats": stats}
+        # Out of time while downloading: keep the text parsed so far
+        print(f"Timed out fetching {url}: {e}")
+        stats["truncated"] = True
+        stats["timed_out"] = True
+    
+    # Same title fallbacks as `extract_title`: <title>, then <h1>, then the URL
+    title = parser.title.strip() or parser.h1.strip() or url.split('/')[-1].replace('-', ' ').title()
+    return {"content": parser.content(), "title": title.strip(), "stats": stats}
+
+# Function to fetch content from a URL
+def fetch_content(url):
+    """
+    Extract article content from a URL.
+    
+    Args:
+        url (str): The URL to fetch content from
         
-        # Extract paragraphs from article or fallback to all paragraphs if article not found
-        paragraphs = article_content.find_all('p') if article_content else soup.find_all('p')
+    Returns:
+        str: The extracted text content from the article
+    """
+    return fetch_article(url)["content"]
+
+# Function to aggregate per-article fetch statistics
+def summarize_fetch_stats(stats):
+    """
+    Aggregate the per-article statistics returned by `fetch_article`.
+    
+    Args:
+        stats (list): List of "stats" dictionaries from `fetch_article`
         
-        # Join all paragraph text into a single string
-        content = ' '.join([para.get_text().strip() for para in paragraphs if para.get_text().strip()])
-        return content
-    except Exception as e:
-        print(f"Error fetching {url}: {e}")
-        return ""
+    Returns:
+        dict: Totals for bytes transferred and the bytes avoided by truncating
+              downloads, along with skip/truncation counts
+    """
+    # Savings can only be measured for responses that declared their length
+    bytes_saved = sum(max(s["content_length"] - s["bytes_transferred"], 0)
+                      for s in stats if s["content_length"] is not None)
+    return {
+        "articles_fetched": len(stats),
+        "bytes_read": sum(s["bytes_read"] for s in stats),
+        "bytes_transferred": sum(s["bytes_transferred"] for s in stats),
+        "bytes_saved": bytes_saved,
+        "peak_article_bytes": max((s["bytes_read"] for s in stats), default=0),
+        "truncated": sum(1 for s in stats if s["truncated"]),
+        "skipped_non_html": sum(1 for s in stats if s["skipped"]),
+        "timed_out": sum(1 for s in stats if s["timed_out"]),
+        "errors": sum(1 for s in stats if s["error"])
+    }
 
 # Function to analyze sentiment of text
 def analyze_sentiment(text):
@@ -185,16 +524,226 @@ def extract_title(soup, url):
     
     return title.strip()
 
+# Number of relevant search results that are fetched and analyzed
+RELEVANCE_TOP_K = 10
+
+# Candidates scoring below this are dropped before any article fetch
+MIN_RELEVANCE_SCORE = 1.0
+
+# Alternative names and tickers that identify each company in headlines, and
+# phrases showing an ambiguous name is used in its everyday sense
+COMPANY_ALIASES = {
+    'apple': {
+        'aliases': ['apple inc', 'aapl', 'iphone', 'ipad', 'macbook', 'tim cook', 'cupertino'],
+        'exclude': ['apple pie', 'apple cider', 'apple orchard', 'recipe', 'fruit', 'big apple']
+    },
+    'shell': {
+        'aliases': ['shell plc', 'royal dutch shell', 'shell oil', 'shel', 'wael sawan'],
+        'exclude': ['seashell', 'sea shell', 'shell script', 'bash shell', 'eggshell', 'shell shock', 'shell company']
+    },
+    'amazon': {
+        'aliases': ['amazon.com', 'amzn', 'aws', 'amazon web services', 'andy jassy', 'prime video'],
+        'exclude': ['amazon rainforest', 'amazon river', 'amazon basin', 'deforestation']
+    },
+    'tesla': {
+        'aliases': ['tsla', 'tesla inc', 'elon musk', 'model 3', 'model y', 'cybertruck'],
+        'exclude': ['nikola tesla', 'tesla coil']
+    },
+    'oracle': {
+        'aliases': ['orcl', 'oracle corp', 'larry ellison', 'oracle cloud'],
+        'exclude': ['oracle of delphi', 'oracle of omaha']
+    },
+    'jaguar': {
+        'aliases': ['jaguar land rover', 'jlr', 'tata motors'],
+        'exclude': ['wildlife', 'big cat', 'jacksonville jaguars']
+    },
+    'target': {
+        'aliases': ['target corp', 'tgt', 'target stores'],
+        'exclude': ['target audience', 'inflation target', 'sales target']
+    },
+    'reliance': {
+        'aliases': ['reliance industries', 'ril', 'jio', 'mukesh ambani', 'reliance retail'],
+        'exclude': ['reliance on', 'reliance upon', 'self-reliance']
+    },
+    'tata motors': {
+        'aliases': ['tatamotors', 'jaguar land rover', 'jlr', 'tata group'],
+        'exclude': []
+    },
+    'infosys': {
+        'aliases': ['infy', 'infosys ltd', 'salil parekh'],
+        'exclude': []
+    },
+    'adani': {
+        'aliases': ['adani group', 'adani enterprises', 'adani ports', 'gautam adani'],
+        'exclude': []
+    },
+    'tcs': {
+        'aliases': ['tata consultancy services', 'tata consultancy', 'k krithivasan'],
+        'exclude': []
+    }
+}
+
+# Reverse index so that a company entered by one of its aliases (e.g. its full
+# name) finds its COMPANY_ALIASES entry; the first entry listing an alias wins
+ALIAS_INDEX = {}
+for _key, _entry in COMPANY_ALIASES.items():
+    for _alias in _entry['aliases']:
+        ALIAS_INDEX.setdefault(_alias, _key)
+
+# Corporate suffixes ignored when looking up a company in COMPANY_ALIASES
+COMPANY_SUFFIX_PATTERN = re.compile(r'[\s,]+(inc|corp|corporation|ltd|limited|plc|co|company|group)\.?$', re.IGNORECASE)
+
+# Terms suggesting a result is business news rather than an unrelated use of the name
+BUSINESS_TERMS_PATTERN = re.compile(
+    r'\b(shares?|stocks?|revenue|earnings|profits?|quarter|ceo|investors?|market|'
+    r'company|launch(es|ed)?|deal|acquisition|sales|ipo|valuation|results)\b',
+    re.IGNORECASE
+)
+
+# URL paths of tag, topic, search and quote pages that list articles instead of being one
+LISTING_PATH_PATTERN = re.compile(r'/(tag|tags|topic|topics|category|search|quote|quotes|author|latest)(/|$)', re.IGNORECASE)
+
+# Function to build the precompiled matchers used to score search results
+@lru_cache(maxsize=128)
+def relevance_matchers(company):
+    """
+    Build precompiled regular expressions for recognising a company in text.
+    
+    Args:
+        company (str): The company name as entered by the user
+        
+    Returns:
+        tuple: Patterns for the company name, its aliases and phrases that
+               indicate an unrelated meaning; each is None when there is nothing
+               to match (the name pattern only for a blank company name)
+    """
+    full_name = company.strip().lower()
+    name = COMPANY_SUFFIX_PATTERN.sub('', full_name)
+    
+    # Look the company up by its key first, then by any of the listed aliases
+    key = next((candidate for candidate in (name, full_name) if candidate in COMPANY_ALIASES), None)
+    if key is None:
+        key = next((ALIAS_INDEX[candidate] for candidate in (name, full_name) if candidate in ALIAS_INDEX), None)
+    entry = COMPANY_ALIASES.get(key, {})
+    
+    def compile_terms(terms):
+        # Blank terms would compile to a pattern matching the empty string
+        terms = [term for term in dict.fromkeys(terms or []) if term.strip()]
+        if not terms:
+            return None
+        alternatives = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+        return re.compile(rf'(?<!\w)({alternatives})(?!\w)', re.IGNORECASE)
+    
+    return (
+        compile_terms([name, full_name, key or '']),
+        compile_terms(entry.get('aliases')),
+        compile_terms(entry.get('exclude'))
+    )
+
+# Function to score how likely a search result is about the company
+def score_candidate(candidate, company):
+    """
+    Score a search result from its title, snippet and URL without fetching it.
+    
+    Args:
+        candidate (dict): Search result with "link", "title" and "snippet"
+        company (str): The company name to score against
+        
+    Returns:
+        float: Relevance score, higher is more relevant
+    """
+    name_pattern, alias_pattern, exclude_pattern = relevance_matchers(company)
+    # Nothing can be relevant to a blank company name
+    if name_pattern is None:
+        return 0.0
+    title = candidate['title']
+    snippet = candidate['snippet']
+    path = urllib.parse.urlparse(candidate['link']).path
+    
+    # Without a title or snippet nothing is known, so keep it at the threshold
+    if not title and not snippet:
+        score = MIN_RELEVANCE_SCORE
+    else:
+        text = f"{title} {snippet}"
+        score = 0.0
+        # Mentions in the headline count most
+        if name_pattern.search(title):
+            score += 3
+        elif name_pattern.search(snippet):
+            score += 1.5
+        if alias_pattern and alias_pattern.search(text):
+            score += 2 if alias_pattern.search(title) else 1
+        # Business context only helps if the company is mentioned at all
+        if score > 0:
+            score += min(len(BUSINESS_TERMS_PATTERN.findall(text)) * 0.5, 2)
+        if exclude_pattern and exclude_pattern.search(text):
+            score -= 3
+    
+    # Company name in the article slug is a cheap extra signal
+    if name_pattern.search(path.replace('-', ' ').replace('_', ' ')):
+        score += 0.5
+    # Tag, topic and search pages are not single articles
+    if LISTING_PATH_PATTERN.search(path) or path in ('', '/'):
+        score -= 2
+    return score
+
+# Function to keep only the most relevant search results
+def rank_candidates(candidates, company, top_k=RELEVANCE_TOP_K):
+    """
+    Drop irrelevant search results and keep the top-k most relevant ones.
+    
+    If no result reaches MIN_RELEVANCE_SCORE (e.g. headlines only use a short
+    form the alias dictionary does not know), the top-k results by score are
+    kept instead, leaving out only clear negatives: results whose score is
+    below zero because of an unrelated-meaning phrase or a listing page.
+    
+    Args:
+        candidates (list): Search results from `search_candidates`
+        company (str): The company name to score against
+        top_k (int): Maximum number of results to keep
+        
+    Returns:
+        tuple: List of kept candidates ordered by relevance, and a dictionary of
+               pruning statistics
+    """
+    scored = [(score_candidate(candidate, company), index, candidate) for index, candidate in enumerate(candidates)]
+    relevant = [item for item in scored if item[0] >= MIN_RELEVANCE_SCORE]
+    
+    # Nothing looked relevant: rank what is not clearly unrelated rather than return nothing
+    fallback = not relevant
+    if fallback:
+        relevant = [item for item in scored if item[0] >= 0]
+    
+    # Highest score first, ties keep their search order
+    relevant.sort(key=lambda item: (-item[0], item[1]))
+    kept = [candidate for _, _, candidate in relevant[:top_k]]
+    
+    total = len(candidates)
+    stats = {
+        "candidates": total,
+        "irrelevant": total - len(relevant),
+        "beyond_top_k": max(len(relevant) - top_k, 0),
+        "processed": len(kept),
+        "pruning_ratio": round((total - len(kept)) / total, 2) if total else 0.0,
+        "fallback": fallback
+    }
+    return kept, stats
+
 # Function to search for news articles about a company
-def search_news(company):
+def search_candidates(company, deadline=None, stats=None):
     """
     Search for recent news articles about the specified company.
     
     Args:
         company (str): The company name to search for
+        deadline (float, optional): Deadline from `make_deadline`; search engines
+            not queried by then are skipped
+        stats (dict, optional): If given, filled with the number of search
+            engines queried, skipped, and cut short by the deadline
         
     Returns:
-        list: List of article URLs
+        list: List of dictionaries with the "link", "title" and "snippet" shown
+              on the search results page
     """
     # Multiple search engines and queries for better coverage
     search_engines = [
@@ -213,62 +762,110 @@ def search_news(company):
         "Accept-Language": "en-US,en;q=0.5"
     }
     
-    links = set()
+    # Candidates keyed by link, in the order they were found
+    candidates = {}
+    
+    def add_candidate(link, title, snippet):
+        title = ' '.join(title.split())
+        snippet = ' '.join(snippet.split())
+        existing = candidates.setdefault(link, {"link": link, "title": "", "snippet": ""})
+        # Different engines show different text for the same link; keep the fuller one
+        if len(title) > len(existing["title"]):
+            existing["title"] = title
+        if len(snippet) > len(existing["snippet"]):
+            existing["snippet"] = snippet
+    
+    def text_of(element):
+        return element.get_text(' ') if element else ''
+    
+    queried = 0
+    timed_out = 0
     
     # Iterate through each search engine
     for search_url in search_engines:
+        # Stop searching when the latency budget is used up
+        if remaining_time(deadline) == 0:
+            break
+        queried += 1
         try:
             # Send request and get response
-            response = requests.get(search_url, headers=headers, timeout=15)
+            response = requests.get(search_url, headers=headers, timeout=bounded_timeout(15, deadline))
             response.raise_for_status()
             
             # Parse HTML content
             soup = BeautifulSoup(response.text, 'html.parser')
             
-            # Extract links based on the search engine's HTML structure
+            # Extract links, titles and snippets based on the search engine's HTML structure
             if 'bing.com' in search_url:
                 for article in soup.select('.news-card, .newsitem'):
                     link = article.select_one('a[href^="http"]')
                     if link and 'microsoft' not in link['href']:
-                        links.add(link['href'])
+                        title = article.get('data-title') or text_of(article.select_one('a.title')) or text_of(link)
+                        snippet = article.get('data-snippet') or text_of(article.select_one('.snippet'))
+                        add_candidate(link['href'], title, snippet)
             
             elif 'news.google.com' in search_url:
                 for article in soup.select('article'):
+                    headline = text_of(article.select_one('h3, h4'))
                     for link in article.select('a[href^="./article"]'):
                         real_link = f"https://news.google.com{link['href'][1:]}"
-                        links.add(real_link)
+                        add_candidate(real_link, headline or text_of(link), '')
             
             elif 'duckduckgo.com' in search_url:
                 for result in soup.select('.result'):
                     link = result.select_one('a[href^="http"]')
                     if link:
-                        links.add(link['href'])
+                        title = text_of(result.select_one('.result__a')) or text_of(link)
+                        add_candidate(link['href'], title, text_of(result.select_one('.result__snippet')))
             
             # Stop if we have enough links
-            if len(links) >= 30:
+            if len(candidates) >= 30:
                 break
                 
             # Delay to avoid rate limiting
-            time.sleep(1)
+            time.sleep(bounded_timeout(1, deadline))
             
         except Exception as e:
             print(f"Error fetching news from {search_url}: {e}")
+            if is_deadline_timeout(e, deadline):
+                timed_out += 1
             continue
     
+    if stats is not None:
+        # Engines left out because enough links were found do not count as skipped
+        stats["engines_queried"] = queried
+        stats["engines_skipped"] = 0 if len(candidates) >= 30 else len(search_engines) - queried
+        stats["engines_timed_out"] = timed_out
+    
     # Filter out social media links
     excluded_domains = {'twitter.com', 'facebook.com', 'instagram.com', 'youtube.com', 'linkedin.com'}
-    valid_links = [link for link in links if not any(domain in link.lower() for domain in excluded_domains)]
+    return [candidate for link, candidate in candidates.items()
+            if not any(domain in link.lower() for domain in excluded_domains)]
+
+# Function to search for news article URLs about a company
+def search_news(company):
+    """
+    Search for recent news articles about the specified company.
     
+    Args:
+        company (str): The company name to search for
+        
+    Returns:
+        list: List of article URLs
+    """
     # Return the top 15 links
-    return valid_links[:15]
+    return [candidate["link"] for candidate in search_candidates(company)][:15]
 
 # Function to process a single URL and extract article data
-def process_url(url):
+def process_url(url, fetch_stats=None, deadline=None):
     """
     Process a single news article URL to extract relevant information.
     
     Args:
         url (str): The article URL to process
+        fetch_stats (list, optional): If given, the download statistics of the
+            article are appended to it
+        deadline (float, optional): Deadline from `make_deadline` for the download
         
     Returns:
         dict: Dictionary containing article data (title, summary, sentiment, etc.)
@@ -276,16 +873,16 @@ def process_url(url):
     try:
         print(f"Processing: {url}")
         
-        # Fetch the article content
-        content = fetch_content(url)
+        # Fetch the article content and title in a single streamed request
+        page = fetch_article(url, deadline=deadline)
+        if fetch_stats is not None:
+            fetch_stats.append(page["stats"])
+        content = page["content"]
         
         if content:
-            # Get full HTML for title extraction
-            response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract article metadata
-            title = extract_title(soup, url)
+            # Extract article metadata; keywords only see the text collected
+            # within ANALYSIS_CHAR_BUDGET, not the whole article
+            title = page["title"]
             summary = summarize_text(content)
             keywords = extract_keywords(content)
             
@@ -307,22 +904,54 @@ def process_url(url):
     return None
 
 # Function to process multiple news articles in parallel
-def process_news(company):
+def process_news(company, metrics=None, top_k=RELEVANCE_TOP_K, deadline=None):
     """
     Search for and process news articles about the company in parallel.
     
+    With a deadline, search and article fetching each get a share of the
+    remaining budget. Articles still being fetched when their share runs out
+    are abandoned and only the finished ones are returned.
+    
     Args:
         company (str): The company name to search for
+        metrics (dict, optional): If given, filled with pipeline metrics: search
+            statistics under "search", the relevance pruning statistics under
+            "relevance", the aggregated download statistics under "fetch" and
+            the stages cut short by the deadline under "incomplete_stages"
+        top_k (int): Maximum number of relevant articles to fetch
+        deadline (float, optional): Deadline from `make_deadline`
         
     Returns:
         list: List of dictionaries containing processed article data
     """
-    # Search for news articles
-    links = search_news(company)
+    incomplete_stages = []
+    
+    # Search for news articles and keep only relevant ones before fetching
+    search_stats = {}
+    found = search_candidates(company, stage_deadline(deadline, SEARCH_BUDGET_SHARE), search_stats)
+    if search_stats["engines_skipped"] or search_stats["engines_timed_out"]:
+        incomplete_stages.append("search")
+    candidates, relevance_stats = rank_candidates(found, company, top_k)
+    links = [candidate["link"] for candidate in candidates]
     
     # Process URLs in parallel using thread pool
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        results = list(executor.map(process_url, links))
+    fetch_deadline = stage_deadline(deadline, FETCH_BUDGET_SHARE)
+    fetch_stats = []
+    executor = ThreadPoolExecutor(max_workers=5)
+    futures = [executor.submit(process_url, url, fetch_stats, fetch_deadline) for url in links]
+    done, not_done = wait(futures, timeout=remaining_time(fetch_deadline))
+    # Cancel queued fetches and stop waiting for running ones once out of time
+    executor.shutdown(wait=False, cancel_futures=True)
+    results = [future.result() for future in futures if future in done]
+    if not_done or any(stats["timed_out"] for stats in fetch_stats):
+        incomplete_stages.append("fetch")
+    
+    if metrics is not None:
+        metrics["search"] = search_stats
+        metrics["relevance"] = relevance_stats
+        metrics["fetch"] = summarize_fetch_stats(list(fetch_stats))
+        metrics["fetch"]["abandoned"] = len(not_done)
+        metrics["incomplete_stages"] = incomplete_stages
     
     # Filter out any failed processing attempts
     return [result for result in results if result]
@@ -383,17 +1012,328 @@ def comparative_analysis(articles):
         }
     }
 
+# Output languages used when a caller does not ask for specific ones
+DEFAULT_LANGUAGES = ['hi']
+
+# Indian languages supported by both googletrans and gTTS
+LANGUAGE_NAMES = {
+    'hi': 'Hindi',
+    'bn': 'Bengali',
+    'gu': 'Gujarati',
+    'kn': 'Kannada',
+    'ml': 'Malayalam',
+    'mr': 'Marathi',
+    'ne': 'Nepali',
+    'pa': 'Punjabi',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'ur': 'Urdu'
+}
+
+# Cap on languages translated and voiced at the same time
+LANGUAGE_WORKERS = 6
+
+# Sentence boundaries for speech synthesis, including the Devanagari danda
+SPEECH_SENTENCE_PATTERN = re.compile(r'(?<=[.!?\u0964])\s+')
+
+# Number of sentences synthesized ahead of the one being streamed
+TTS_WORKERS = 4
+
+# Size of the pieces a stored audio file is read and sent in
+AUDIO_CHUNK_SIZE = 64 * 1024
+
+# Cap on gTTS requests in flight across all requests and languages, to stay
+# clear of the TTS endpoint's rate limiting
+TTS_MAX_CONCURRENCY = 6
+TTS_SLOTS = threading.BoundedSemaphore(TTS_MAX_CONCURRENCY)
+
+# Function to build the content-addressed id of an audio file
+def audio_id_for(text, lang):
+    """
+    Get the id under which the speech for a text is stored.
+    
+    The id is a hash of the language and text, so the same summary always maps
+    to the same immutable file and concurrent requests never clash.
+    
+    Args:
+        text (str): The text being spoken
+        lang (str): Language code of the text
+        
+    Returns:
+        str: Audio id of the form "<lang>_<32 hex digits>"
+    """
+    digest = hashlib.sha256(f"{lang}\0{text}".encode('utf-8')).hexdigest()
+    return f"{lang}_{digest[:32]}"
+
+# Function to build the path of a generated audio file
+def audio_path(audio_id):
+    """
+    Get the file path of the audio generated under the given id.
+    
+    Args:
+        audio_id (str): Identifier returned by `translate_and_speak`
+        
+    Returns:
+        str: Path of the MP3 file
+    """
+    return f"summary_{audio_id}.mp3"
+
+# Function to synthesize speech sentence by sentence
+def synthesize_sentences(text, lang, workers=1, deadline=None):
+    """
+    Generate MP3 audio for a text one sentence at a time.
+    
+    With more than one worker, up to `workers` sentences are synthesized ahead
+    while earlier ones are yielded in order, so the first sentence is available
+    as soon as its own synthesis finishes. MP3 frames can be concatenated, so
+    the chunks together form one playable file.
+    
+    Args:
+        text (str): The text to speak
+        lang (str): Language code of the text
+        workers (int): Number of sentences synthesized concurrently
+        deadline (float, optional): Deadline from `make_deadline`; no further
+            sentence is started once it has passed
+        
+    Yields:
+        bytes: MP3 data for each sentence, in order
+        
+    Raises:
+        TimeoutError: If the deadline passed before every sentence was started
+    """
+    sentences = [sentence for sentence in SPEECH_SENTENCE_PATTERN.split(text.strip()) if sentence.strip()]
+    
+    def speak(sentence):
+        buffer = io.BytesIO()
+        with TTS_SLOTS:
+            gTTS(text=sentence, lang=lang).write_to_fp(buffer)
+        return buffer.getvalue()
+    
+    def check_deadline():
+        if remaining_time(deadline) == 0:
+            raise TimeoutError("Latency budget exhausted before the speech was finished")
+    
+    if workers <= 1:
+        for sentence in sentences:
+            check_deadline()
+            yield speak(sentence)
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # Keep at most `workers` sentences in flight ahead of the consumer
+        pending = []
+        for sentence in sentences:
+            check_deadline()
+            pending.append(executor.submit(speak, sentence))
+            if len(pending) >= workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+    finally:
+        # Stop pending sentences if the consumer stops early (e.g. client disconnect)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# Function to stream speech while saving it to the audio store
+def stream_speech(text, lang, workers=1, deadline=None):
+    """
+    Stream the MP3 audio of a text, saving it under its audio id on completion.
+    
+    If the audio already exists it is read back instead of being synthesized.
+    Audio is written to a temporary file and only moved into place once every
+    sentence has been synthesized, so a partial file is never served.
+    
+    Args:
+        text (str): The text to speak
+        lang (str): Language code of the text
+        workers (int): Number of sentences synthesized concurrently
+        deadline (float, optional): Deadline from `make_deadline`; synthesis
+            stops between sentences once it passes and nothing is saved
+        
+    Yields:
+        bytes: MP3 data chunks
+        
+    Raises:
+        ValueError: If the text is empty, which would store an empty MP3
+    """
+    if not text or not text.strip():
+        raise ValueError("No text to convert to speech")
+    
+    path = audio_path(audio_id_for(text, lang))
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(AUDIO_CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+    
+    temp_path = f"{path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(temp_path, 'wb') as f:
+            for chunk in synthesize_sentences(text, lang, workers, deadline):
+                f.write(chunk)
+                yield chunk
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+# Function to synthesize and store speech without streaming it
+def save_speech(text, lang, deadline=None):
+    """
+    Synthesize the speech for a text into the audio store.
+    
+    Args:
+        text (str): The text to speak
+        lang (str): Language code of the text
+        deadline (float, optional): Deadline from `make_deadline`
+        
+    Returns:
+        str: The audio id of the saved file
+        
+    Raises:
+        TimeoutError: If the deadline passed before the speech was finished
+        ValueError: If the text is empty
+    """
+    for _ in stream_speech(text, lang, deadline=deadline):
+        pass
+    return audio_id_for(text, lang)
+
+# Function to translate English text into another language
+def translate_text(text, lang, deadline=None):
+    """
+    Translate English text into one language.
+    
+    Args:
+        text (str): The English text to translate
+        lang (str): Target language code (e.g. 'hi', 'ta')
+        deadline (float, optional): Deadline from `make_deadline`, used as the
+            request timeout
+        
+    Returns:
+        str: The translated text
+    """
+    # googletrans clients are not shared between threads, so create one per call
+    translator = Translator(timeout=remaining_time(deadline))
+    return translator.translate(text, src='en', dest=lang).text
+
+# Function to translate a summary and convert it to speech
+def translate_and_speak(text, lang, deadline=None):
+    """
+    Translate English text into one language and save its speech as MP3.
+    
+    Args:
+        text (str): The English text to translate
+        lang (str): Target language code (e.g. 'hi', 'ta')
+        deadline (float, optional): Deadline from `make_deadline`; the audio is
+            skipped if it cannot be finished in time
+        
+    Returns:
+        dict: Dictionary containing the translated text and the audio id, plus
+              "skipped": "audio" when the audio was left out for lack of time
+    """
+    translated = translate_text(text, lang, deadline)
+    
+    remaining = remaining_time(deadline)
+    if remaining is not None and remaining < AUDIO_MIN_SECONDS:
+        return {"text": translated, "audio_id": None, "skipped": "audio"}
+    try:
+        return {"text": translated, "audio_id": save_speech(translated, lang, deadline)}
+    except TimeoutError:
+        return {"text": translated, "audio_id": None, "skipped": "audio"}
+
+# Function to translate a summary into several languages in parallel
+def localize_summary(text, languages, deadline=None):
+    """
+    Translate an English summary and synthesize audio for each target language.
+    
+    All languages are translated concurrently first, then the audio for every
+    successful translation is synthesized concurrently with the time that is
+    left. Each language is independent, so a failure in one is reported in its
+    own entry without affecting the others, and a translation whose audio could
+    not be made in time is still returned.
+    
+    Args:
+        text (str): The English summary
+        languages (list): Target language codes
+        deadline (float, optional): Deadline from `make_deadline`; translation
+            or audio is skipped when too little time is left for it
+        
+    Returns:
+        dict: Mapping of language code to {"text", "audio_id"}; "error" is added
+              when a stage failed, and "skipped" names the stage ("translation"
+              or "audio") left out because of the deadline
+    """
+    # Drop duplicates while keeping the requested order
+    languages = list(dict.fromkeys(languages))
+    if not languages:
+        return {}
+    
+    remaining = remaining_time(deadline)
+    if remaining is not None and remaining < TRANSLATION_MIN_SECONDS:
+        return {lang: {"text": None, "audio_id": None, "error": "Latency budget exhausted", "skipped": "translation"}
+                for lang in languages}
+    
+    executor = ThreadPoolExecutor(max_workers=min(len(languages), LANGUAGE_WORKERS))
+    try:
+        # Translate every language before starting any audio
+        futures = {lang: executor.submit(translate_text, text, lang, deadline) for lang in languages}
+        done, _ = wait(futures.values(), timeout=remaining)
+        
+        translations = {}
+        for lang, future in futures.items():
+            if future not in done:
+                translations[lang] = {"text": None, "audio_id": None, "error": "Timed out", "skipped": "translation"}
+                continue
+            try:
+                translations[lang] = {"text": future.result(), "audio_id": None}
+            except Exception as e:
+                print(f"Error creating {LANGUAGE_NAMES.get(lang, lang)} summary: {e}")
+                translations[lang] = {"text": None, "audio_id": None, "error": str(e)}
+        
+        translated = [lang for lang, result in translations.items() if result["text"]]
+        remaining = remaining_time(deadline)
+        if remaining is not None and remaining < AUDIO_MIN_SECONDS:
+            for lang in translated:
+                translations[lang]["skipped"] = "audio"
+            return translations
+        
+        # Synthesize audio with whatever time is left; synthesis stops between
+        # sentences at the deadline, so abandoned work does not run on for long
+        futures = {lang: executor.submit(save_speech, translations[lang]["text"], lang, deadline) for lang in translated}
+        done, _ = wait(futures.values(), timeout=remaining)
+        for lang, future in futures.items():
+            if future not in done:
+                translations[lang]["skipped"] = "audio"
+                continue
+            try:
+                translations[lang]["audio_id"] = future.result()
+            except TimeoutError:
+                translations[lang]["skipped"] = "audio"
+            except Exception as e:
+                print(f"Error creating {LANGUAGE_NAMES.get(lang, lang)} audio: {e}")
+                translations[lang]["error"] = str(e)
+        return translations
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 # Function to generate a final summary of all articles
-def final_summary(articles, company_name):
+def final_summary(articles, company_name, languages=None, deadline=None):
     """
     Generate a comprehensive summary of all news articles.
     
     Args:
         articles (list): List of processed article dictionaries
         company_name (str): Name of the company
+        languages (list, optional): Target language codes for translation and
+            audio, defaults to DEFAULT_LANGUAGES; an empty list skips translation
+        deadline (float, optional): Deadline from `make_deadline` for the
+            translation and audio stages
         
     Returns:
-        dict: Dictionary containing text summary, Hindi translation, and audio file path
+        dict: Dictionary containing text summary, Hindi translation, audio file path
+              and the per-language translations from `localize_summary`
     """
     if not articles:
         return "No articles available for summary."
@@ -427,30 +1367,19 @@ def final_summary(articles, company_name):
     summary += f"Key topics discussed: {', '.join(main_topics)}. "
     summary += "Market implications depend on how these developments unfold."
     
-    try:
-        # Translate summary to Hindi
-        translator = Translator()
-        hindi_summary = translator.translate(summary, dest='hi').text
-        
-        # Create audio file of Hindi summary
-        tts = gTTS(text=hindi_summary, lang='hi')
-        audio_filename = f"summary_{time.strftime('%Y%m%d_%H%M%S')}.mp3"
-        tts.save(audio_filename)
-        
-        # Return all summary formats
-        return {
-            "text_summary": summary,
-            "hindi_summary": hindi_summary,
-            "audio_file": audio_filename
-        }
-    except Exception as e:
-        print(f"Error creating audio summary: {e}")
-        # Return text-only summary if translation/audio fails
-        return {
-            "text_summary": summary,
-            "hindi_summary": None,
-            "audio_file": None
-        }
+    # Translate the English summary once per target language, in parallel
+    if languages is None:
+        languages = DEFAULT_LANGUAGES
+    translations = localize_summary(summary, languages, deadline)
+    hindi = translations.get('hi', {})
+    
+    # Return all summary formats
+    return {
+        "text_summary": summary,
+        "hindi_summary": hindi.get("text"),
+        "audio_file": audio_path(hindi["audio_id"]) if hindi.get("audio_id") else None,
+        "translations": translations
+    }
 
 # Main function to execute the entire analysis
 def main():
@@ -467,7 +1396,8 @@ def main():
         print("\nFetching news articles...\n")
         
         # Process news articles
-        news_data = process_news(company)
+        metrics = {}
+        news_data = process_news(company, metrics)
         
         # Handle case where no articles are found
         if not news_data:
@@ -485,7 +1415,8 @@ def main():
             "articles": news_data,
             "comparative_analysis": analysis,
             "final_summary": final_summ["text_summary"],
-            "hindi_summary": final_summ["hindi_summary"]
+            "hindi_summary": final_summ["hindi_summary"],
+            "metrics": metrics
         }
 
         # Display JSON output